@@ -0,0 +1,204 @@
+"""Stand-in fail2ban server for benchmarks.
+
+Speaks the fail2ban socket protocol (pickled argument lists terminated by
+<F2B_END_COMMAND>) and answers the commands fail2web sends over the socket
+from in-memory jails, so the web app can be measured without root, iptables
+or a real fail2ban daemon.
+
+    python bench/fake_fail2ban.py --socket /tmp/f2b.sock --jails 20 --bans 5000 \
+        --latency 1 --latency banip=5
+"""
+import argparse
+import os
+import pickle
+import socketserver
+import threading
+import time
+
+END = b'<F2B_END_COMMAND>'
+CLOSE = b'<F2B_CLOSE_COMMAND>'
+
+
+def fake_ip(n, first_octet=100):
+    """Deterministic IPv4 address for index n, outside fail2web's default ignoreip ranges"""
+    return f'{first_octet + ((n >> 24) & 63)}.{(n >> 16) & 255}.{(n >> 8) & 255}.{n & 255}'
+
+
+class FakeJail:
+    def __init__(self, name, bans, bantime=600):
+        now = time.time()
+        self.name = name
+        self.bantime = bantime
+        # ip -> ban time; spread over the last bantime seconds
+        self.banned = {fake_ip(i): now - (i % bantime) for i in range(bans)}
+        self.total_banned = bans
+        self.currently_failed = 0
+        self.total_failed = bans * 3
+        self.ignoreip = set()
+        self.lock = threading.Lock()
+
+    def status(self):
+        with self.lock:
+            banned = list(self.banned)
+            return [
+                ('Filter', [('Currently failed', self.currently_failed),
+                            ('Total failed', self.total_failed),
+                            ('File list', [f'/var/log/{self.name}.log'])]),
+                ('Actions', [('Currently banned', len(banned)),
+                             ('Total banned', self.total_banned),
+                             ('Banned IP list', banned)]),
+            ]
+
+    def ban(self, ips):
+        with self.lock:
+            added = [ip for ip in ips if ip not in self.banned]
+            now = time.time()
+            for ip in added:
+                self.banned[ip] = now
+            self.total_banned += len(added)
+            return len(added)
+
+    def unban(self, ips):
+        with self.lock:
+            removed = [ip for ip in ips if self.banned.pop(ip, None) is not None]
+            return len(removed)
+
+    def banip_with_time(self):
+        with self.lock:
+            return [f'{ip} \t{time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(start))} + {self.bantime} = '
+                    f'{time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(start + self.bantime))}'
+                    for ip, start in self.banned.items()]
+
+
+class FakeServer:
+    """The command handling behind the socket"""
+
+    def __init__(self, jails, bans, latency):
+        self.jails = {f'jail-{i}': FakeJail(f'jail-{i}', bans) for i in range(jails)}
+        self.latency = latency
+
+    def verb(self, args):
+        if args[0] in ('set', 'get') and len(args) > 2:
+            return args[2]
+        return args[0]
+
+    def handle(self, args):
+        delay = self.latency.get(self.verb(args), self.latency.get('default', 0))
+        if delay:
+            time.sleep(delay)
+        try:
+            return 0, self.dispatch(args)
+        except KeyError as e:
+            return 1, KeyError(f'Unknown jail or command {e}')
+        except (IndexError, ValueError) as e:
+            return 1, ValueError(f'Invalid command {args!r}: {e}')
+
+    def dispatch(self, args):
+        command = args[0]
+        if command == 'ping':
+            return 'pong'
+        if command == 'version':
+            return '1.0.2-fake'
+        if command == 'echo':
+            return args[1:]
+        if command == 'status' and len(args) == 1:
+            return [('Number of jail', len(self.jails)), ('Jail list', ', '.join(self.jails))]
+        if command == 'status':
+            return self.jails[args[1]].status()
+        if command == 'banned':
+            if len(args) > 1:
+                return [[name for name, jail in self.jails.items() if ip in jail.banned] for ip in args[1:]]
+            return [{name: list(jail.banned)} for name, jail in self.jails.items()]
+        if command == 'unban':
+            if args[1:] == ['--all']:
+                return sum(jail.unban(list(jail.banned)) for jail in self.jails.values())
+            return sum(jail.unban(args[1:]) for jail in self.jails.values())
+        if command == 'set':
+            jail = self.jails[args[1]]
+            action = args[2]
+            if action == 'banip':
+                return jail.ban(args[3:])
+            if action == 'unbanip':
+                return jail.unban(args[3:])
+            if action == 'addignoreip':
+                jail.ignoreip.update(args[3:])
+                return sorted(jail.ignoreip)
+            if action == 'delignoreip':
+                jail.ignoreip.difference_update(args[3:])
+                return sorted(jail.ignoreip)
+            raise KeyError(action)
+        if command == 'get':
+            jail = self.jails[args[1]]
+            action = args[2]
+            if action == 'banip':
+                return jail.banip_with_time() if '--with-time' in args else list(jail.banned)
+            if action == 'bantime':
+                return jail.bantime
+            if action == 'ignoreip':
+                return sorted(jail.ignoreip)
+            raise KeyError(action)
+        if command == 'stop' and len(args) > 1:
+            del self.jails[args[1]]
+            return None
+        if command == 'flushlogs':
+            return 'rolled over'
+        raise KeyError(command)
+
+
+def make_handler(server):
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            buffer = b''
+            while True:
+                data = self.request.recv(65536)
+                if not data:
+                    return
+                buffer += data
+                while END in buffer:
+                    message, buffer = buffer.split(END, 1)
+                    if message == CLOSE:
+                        return
+                    reply = server.handle(pickle.loads(message))
+                    self.request.sendall(pickle.dumps(reply, pickle.HIGHEST_PROTOCOL) + END)
+    return Handler
+
+
+class ThreadingUnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def parse_latency(values):
+    """['2', 'banip=5'] -> {'default': 0.002, 'banip': 0.005} (milliseconds in, seconds out)"""
+    latency = {}
+    for value in values or []:
+        verb, _, ms = value.rpartition('=')
+        latency[verb or 'default'] = float(ms) / 1000
+    return latency
+
+
+def serve(socket_path, jails, bans, latency):
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+    return ThreadingUnixServer(socket_path, make_handler(FakeServer(jails, bans, latency)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--socket', default='/tmp/fail2web-bench.sock')
+    parser.add_argument('--jails', type=int, default=10, help='number of jails')
+    parser.add_argument('--bans', type=int, default=1000, help='banned IPs per jail')
+    parser.add_argument('--latency', action='append', metavar='[VERB=]MS',
+                        help='added latency per command in ms, optionally for one verb only')
+    args = parser.parse_args()
+    server = serve(args.socket, args.jails, args.bans, parse_latency(args.latency))
+    print(f'fake fail2ban on {args.socket}: {args.jails} jails x {args.bans} bans', flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        os.unlink(args.socket)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,271 @@
+"""Benchmark fail2web's hot paths against the fake fail2ban server.
+
+Starts bench/fake_fail2ban.py and the app under gunicorn (with the same
+gunicorn.conf.py as the Docker image) in a scratch directory, then drives
+each scenario at the requested concurrency and reports latency percentiles,
+throughput and the app's resident memory.
+
+    python bench/run.py --jails 20 --bans 5000 --concurrency 16 --requests 2000
+    python bench/run.py --scenario banned --latency status=5 --json before.json
+"""
+import argparse
+import http.client
+import itertools
+import json
+import os
+import shutil
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+SRC_DIR = os.path.join(os.path.dirname(BENCH_DIR), 'src')
+sys.path.insert(0, BENCH_DIR)
+
+from fake_fail2ban import fake_ip  # noqa: E402
+
+USERNAME = 'bench'
+PASSWORD = 'bench'
+
+
+class Scenario:
+    """One endpoint under load; request(n) returns (method, path, body) for the n-th call"""
+
+    def __init__(self, name, request):
+        self.name = name
+        self.request = request
+
+
+def scenarios(jails):
+    ban_counter = itertools.count()
+    config_counter = itertools.count()
+    jail_names = [f'jail-{i}' for i in range(jails)]
+
+    def jail_config(n):
+        return ('POST', '/api/jails/config', {
+            'name': f'bench-{next(config_counter) % 50}', 'filter': 'sshd',
+            'logpath': '/var/log/auth.log', 'enabled': True})
+
+    return [
+        Scenario('jails', lambda n: ('GET', '/api/jails', None)),
+        Scenario('overview', lambda n: ('GET', '/api/overview', None)),
+        Scenario('banned', lambda n: ('GET', f'/api/banned/{jail_names[n % jails]}?limit=100', None)),
+        Scenario('banned-search', lambda n: ('GET', f'/api/banned/{jail_names[n % jails]}?q=100.0.1', None)),
+        Scenario('ban', lambda n: ('POST', '/api/ban',
+                                   {'jail': jail_names[n % jails], 'ip': fake_ip(next(ban_counter), 200)})),
+        Scenario('jails-config', lambda n: ('GET', '/api/jails/config', None)),
+        Scenario('jails-config-write', jail_config),
+    ]
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def wait_for(check, timeout=15):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            if check():
+                return
+        except OSError:
+            pass
+        time.sleep(0.1)
+    raise RuntimeError('timed out waiting for the benchmark servers to start')
+
+
+def rss_kb(pid):
+    """Resident memory of pid and all its descendants"""
+    total = 0
+    pending = [pid]
+    while pending:
+        current = pending.pop()
+        try:
+            with open(f'/proc/{current}/status') as f:
+                total += next(int(line.split()[1]) for line in f if line.startswith('VmRSS:'))
+            with open(f'/proc/{current}/task/{current}/children') as f:
+                pending.extend(int(child) for child in f.read().split())
+        except (OSError, StopIteration):
+            continue
+    return total
+
+
+class Client:
+    """Keep-alive HTTP connection per benchmark thread"""
+
+    def __init__(self, port, token):
+        self.port = port
+        self.token = token
+        self.local = threading.local()
+
+    def request(self, method, path, body):
+        conn = getattr(self.local, 'conn', None)
+        if conn is None:
+            conn = self.local.conn = http.client.HTTPConnection('127.0.0.1', self.port, timeout=60)
+        headers = {'Authorization': f'Bearer {self.token}'}
+        payload = None
+        if body is not None:
+            payload = json.dumps(body)
+            headers['Content-Type'] = 'application/json'
+        try:
+            conn.request(method, path, payload, headers)
+            response = conn.getresponse()
+            response.read()
+            return response.status
+        except (OSError, http.client.HTTPException):
+            conn.close()
+            self.local.conn = None
+            raise
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def run_scenario(client, scenario, requests, concurrency, warmup):
+    for n in range(warmup):
+        client.request(*scenario.request(n))
+
+    latencies = [None] * requests
+    errors = 0
+    lock = threading.Lock()
+
+    def one(n):
+        nonlocal errors
+        start = time.perf_counter()
+        try:
+            status = client.request(*scenario.request(n))
+            failed = status >= 400
+        except (OSError, http.client.HTTPException):
+            failed = True
+        latencies[n] = time.perf_counter() - start
+        if failed:
+            with lock:
+                errors += 1
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(one, range(requests)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        'scenario': scenario.name,
+        'requests': requests,
+        'errors': errors,
+        'throughput': round(requests / elapsed, 1),
+        'p50_ms': round(percentile(latencies, 0.50) * 1000, 2),
+        'p90_ms': round(percentile(latencies, 0.90) * 1000, 2),
+        'p99_ms': round(percentile(latencies, 0.99) * 1000, 2),
+        'max_ms': round(latencies[-1] * 1000, 2),
+    }
+
+
+def start_servers(args, workdir):
+    socket_path = os.path.join(workdir, 'fail2ban.sock')
+    fake_cmd = [sys.executable, os.path.join(BENCH_DIR, 'fake_fail2ban.py'), '--socket', socket_path,
+                '--jails', str(args.jails), '--bans', str(args.bans)]
+    for latency in args.latency or []:
+        fake_cmd += ['--latency', latency]
+    fake = subprocess.Popen(fake_cmd, stdout=subprocess.DEVNULL)
+    wait_for(lambda: os.path.exists(socket_path))
+
+    jail_d = os.path.join(workdir, 'jail.d')
+    os.makedirs(jail_d)
+    env = dict(os.environ,
+               FAIL2WEB_SOCKET=socket_path,
+               FAIL2WEB_USERNAME=USERNAME,
+               FAIL2WEB_PASSWORD=PASSWORD,
+               FAIL2WEB_SECRET_KEY='bench-secret',
+               FAIL2WEB_JAIL_D=jail_d,
+               FAIL2WEB_CACHE_PATH=os.path.join(workdir, 'cache.sqlite3'),
+               FAIL2WEB_EVENTS_PATH=os.path.join(workdir, 'events.sqlite3'),
+               FAIL2WEB_JOBS_PATH=os.path.join(workdir, 'jobs.sqlite3'),
+               FAIL2WEB_RELOADS_PATH=os.path.join(workdir, 'reloads.sqlite3'),
+               FAIL2WEB_STATS_PATH=os.path.join(workdir, 'stats.sqlite3'),
+               PROMETHEUS_MULTIPROC_DIR=os.path.join(workdir, 'metrics'))
+    if args.cache_ttl is not None:
+        env['FAIL2WEB_CACHE_TTL'] = str(args.cache_ttl)
+    port = free_port()
+    app_cmd = [sys.executable, '-m', 'gunicorn', '--chdir', SRC_DIR,
+               '--config', os.path.join(SRC_DIR, 'backend', 'gunicorn.conf.py'),
+               '--bind', f'127.0.0.1:{port}', '--log-level', 'warning']
+    if args.workers:
+        app_cmd += ['--workers', str(args.workers)]
+    if args.threads:
+        app_cmd += ['--threads', str(args.threads)]
+    app = subprocess.Popen(app_cmd + ['backend.app:app'], env=env)
+
+    def app_up():
+        conn = http.client.HTTPConnection('127.0.0.1', port, timeout=2)
+        conn.request('GET', '/api/health')
+        return conn.getresponse().status == 200
+    wait_for(app_up)
+    return fake, app, port
+
+
+def login(port):
+    conn = http.client.HTTPConnection('127.0.0.1', port, timeout=10)
+    conn.request('POST', '/api/login', json.dumps({'username': USERNAME, 'password': PASSWORD}),
+                 {'Content-Type': 'application/json'})
+    return json.loads(conn.getresponse().read())['token']
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--jails', type=int, default=10)
+    parser.add_argument('--bans', type=int, default=1000, help='banned IPs per jail')
+    parser.add_argument('--latency', action='append', metavar='[VERB=]MS',
+                        help='fake fail2ban latency per command in ms (repeatable)')
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--requests', type=int, default=500, help='requests per scenario')
+    parser.add_argument('--warmup', type=int, default=20, help='unmeasured requests per scenario')
+    parser.add_argument('--scenario', action='append', help='only run these scenarios (repeatable)')
+    parser.add_argument('--workers', type=int, help='override gunicorn workers')
+    parser.add_argument('--threads', type=int, help='override gunicorn threads per worker')
+    parser.add_argument('--cache-ttl', type=float, help='FAIL2WEB_CACHE_TTL for the run')
+    parser.add_argument('--json', help='also write the results to this file')
+    args = parser.parse_args()
+
+    selected = [s for s in scenarios(args.jails) if not args.scenario or s.name in args.scenario]
+    workdir = tempfile.mkdtemp(prefix='fail2web-bench-')
+    fake = app = None
+    try:
+        fake, app, port = start_servers(args, workdir)
+        client = Client(port, login(port))
+        rss_start = rss_kb(app.pid)
+
+        results = []
+        print(f"{'scenario':<20}{'req/s':>10}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}{'max ms':>10}"
+              f"{'errors':>8}{'rss MB':>9}")
+        for scenario in selected:
+            result = run_scenario(client, scenario, args.requests, args.concurrency, args.warmup)
+            result['rss_mb'] = round(rss_kb(app.pid) / 1024, 1)
+            results.append(result)
+            print(f"{result['scenario']:<20}{result['throughput']:>10}{result['p50_ms']:>10}{result['p90_ms']:>10}"
+                  f"{result['p99_ms']:>10}{result['max_ms']:>10}{result['errors']:>8}{result['rss_mb']:>9}")
+
+        if args.json:
+            with open(args.json, 'w') as f:
+                json.dump({'settings': vars(args), 'rss_start_mb': round(rss_start / 1024, 1),
+                           'results': results}, f, indent=2)
+    finally:
+        for process in (app, fake):
+            if process is not None:
+                process.send_signal(signal.SIGTERM)
+                process.wait(timeout=30)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
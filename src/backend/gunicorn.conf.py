@@ -0,0 +1,25 @@
+import os
+import shutil
+
+# Imported up front: child_exit runs inside the master's SIGCHLD handler
+from prometheus_client import multiprocess
+
+bind = '0.0.0.0:5000'
+workers = 2
+# Threaded workers so long-lived event streams do not tie up a whole worker;
+# at most FAIL2WEB_MAX_STREAMS (default 8) threads per worker serve streams
+worker_class = 'gthread'
+threads = 16
+
+
+def on_starting(server):
+    # Metric files from a previous run would be added to the new totals
+    path = os.environ.get('PROMETHEUS_MULTIPROC_DIR')
+    if path:
+        shutil.rmtree(path, ignore_errors=True)
+        os.makedirs(path, exist_ok=True)
+
+
+def child_exit(server, worker):
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        multiprocess.mark_process_dead(worker.pid)
@@ -0,0 +1,76 @@
+"""Log scanning for the filter test bench.
+
+Kept apart from app.py so the spawned pool processes that run
+scan_log_chunk import only this module, not the whole Flask app.
+"""
+import mmap
+import os
+import re
+import time
+
+# Timestamps fail2ban would cut out of a line before applying failregex
+LOG_DATE_RE = re.compile(
+    r'\[?\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(?:[.,]\d+)?(?:Z|[+-]\d{2}:?\d{2})?\]?\s*'
+    r'|\[\d{2}/\w{3}/\d{4}:\d{2}:\d{2}:\d{2} [+-]\d{4}\]\s*'
+    r'|\b\w{3} [ \d]\d \d{2}:\d{2}:\d{2}\s*'
+)
+
+_regex_cache = {}
+
+def compile_regexes(regexes):
+    key = tuple(regexes)
+    if key not in _regex_cache:
+        _regex_cache[key] = [re.compile(regex) for regex in regexes]
+    return _regex_cache[key]
+
+def scan_log_chunk(path, start, end, failregex, ignoreregex, max_samples):
+    """Match one byte range of a log file; runs in a pool process.
+    
+    The range is widened to whole lines: a chunk owns every line that starts
+    inside it.
+    """
+    fail_res = compile_regexes(failregex)
+    ignore_res = compile_regexes(ignoreregex)
+    counts = [0] * len(fail_res)
+    times = [0] * len(fail_res)
+    result = {'lines': 0, 'matched': 0, 'ignored': 0, 'samples': []}
+    
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            result.update(counts=counts, times_ns=times)
+            return result
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if start > 0:
+                # Skip the line that began in the previous chunk
+                newline = mm.find(b'\n', start - 1)
+                start = len(mm) if newline == -1 else newline + 1
+            mm.seek(start)
+            while mm.tell() < end:
+                raw = mm.readline()
+                if not raw:
+                    break
+                result['lines'] += 1
+                line = raw.decode('utf-8', 'replace').rstrip('\r\n')
+                line = LOG_DATE_RE.sub('', line, count=1)
+                
+                for index, regex in enumerate(fail_res):
+                    began = time.perf_counter_ns()
+                    match = regex.search(line)
+                    times[index] += time.perf_counter_ns() - began
+                    if not match:
+                        continue
+                    if any(ignore.search(line) for ignore in ignore_res):
+                        result['ignored'] += 1
+                        break
+                    counts[index] += 1
+                    result['matched'] += 1
+                    if len(result['samples']) < max_samples:
+                        result['samples'].append({
+                            'regex': index,
+                            'host': match.groupdict().get('host'),
+                            'line': raw.decode('utf-8', 'replace').rstrip('\r\n')
+                        })
+                    break
+    
+    result.update(counts=counts, times_ns=times)
+    return result
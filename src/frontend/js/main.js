@@ -274,6 +274,21 @@ function populateFilterOptions() {
         option.textContent = filter.text;
         filterSelect.appendChild(option);
     });
+    
+    // Add filters installed on the server that the list above does not know
+    authenticatedFetch('/api/filters')
+        .then(data => {
+            const known = new Set(filters.map(filter => filter.value));
+            const customOption = filterSelect.querySelector('option[value="custom"]');
+            (data.filters || []).forEach(filter => {
+                if (known.has(filter.name)) return;
+                const option = document.createElement('option');
+                option.value = filter.name;
+                option.textContent = `${filter.name} (${filter.path})`;
+                filterSelect.insertBefore(option, customOption);
+            });
+        })
+        .catch(error => console.error('Error loading filters:', error));
 }
 
 function hideJailConfig() {
@@ -385,7 +400,10 @@ function saveIgnoreIPToBackend() {
     .then(data => {
         if (data.status !== 'success') {
             console.error('Error auto-saving ignoreIP:', data.error);
+            return;
         }
+        // The server collapses overlapping entries, show what it stored
+        loadIgnoreIP();
     })
     .catch(error => {
         console.error('Error auto-saving ignoreIP:', error);
@@ -497,14 +515,21 @@ function handleJailFormSubmit(event) {
         body: JSON.stringify(formData)
     })
     .then(data => {
+        if (data.status !== 'accepted') {
+            throw new Error(data.error || 'Unknown error');
+        }
+        // The jail is activated with the next batch of configuration changes
+        return waitForChange(data.change_id);
+    })
+    .then(change => {
         // Remove loading indicator
         if (document.body.contains(loadingDiv)) {
             document.body.removeChild(loadingDiv);
         }
         
-        if (data.status === 'success') {
+        if (change.status === 'applied') {
             alert('Jail configuration saved successfully!\n\n' +
-                  (data.jail_active 
+                  (change.result && change.result.jail_active 
                          ? '✅ Jail started and is now active!' 
                          : '⚠️ Config saved. Jail will activate on next reload.'));
             clearJailForm();
@@ -512,7 +537,7 @@ function handleJailFormSubmit(event) {
             renderJailList(); // Refresh active jails
             fetchJails();     // Refresh main jails view
         } else {
-            alert('Error saving jail: ' + (data.error || 'Unknown error'));
+            alert('Error saving jail: ' + (change.error || 'Unknown error'));
         }
     })
     .catch(error => {
@@ -534,6 +559,41 @@ function clearJailForm() {
     document.getElementById('jail-enabled').checked = true;
 }
 
+// Poll url until finished(state) is true; resolves with the final state.
+// onUpdate, if given, sees every intermediate state.
+function pollUntilDone(url, finished, interval = 500, onUpdate = null) {
+    return new Promise((resolve, reject) => {
+        const poll = () => {
+            authenticatedFetch(url)
+                .then(state => {
+                    if (finished(state)) {
+                        resolve(state);
+                    } else {
+                        if (onUpdate) {
+                            onUpdate(state);
+                        }
+                        setTimeout(poll, interval);
+                    }
+                })
+                .catch(reject);
+        };
+        poll();
+    });
+}
+
+// Poll a background job until it finishes; resolves with the final job
+function waitForJob(jobId, onProgress = null) {
+    return pollUntilDone(`/api/jobs/${jobId}`,
+                         job => job.status === 'succeeded' || job.status === 'failed',
+                         1000, onProgress);
+}
+
+// Wait for a scheduled configuration change to be applied or rejected
+function waitForChange(changeId) {
+    return pollUntilDone(`/api/reloads/${changeId}`,
+                         change => change.status === 'applied' || change.status === 'failed');
+}
+
 function loadJailConfigs() {
     const token = getToken();
     if (!token) {
@@ -618,6 +678,7 @@ function renderJailConfigs(jails) {
                     ${jail.enabled ? 'Stop' : 'Start'}
                 </button>
                 <button class="jail-action-btn delete" onclick="deleteJail('${jail.name}')">Delete</button>
+                <button class="jail-action-btn log" onclick="toggleJailLog('${jail.name}', this)">Log</button>
             </div>
         `;
         
@@ -625,6 +686,48 @@ function renderJailConfigs(jails) {
     });
 }
 
+// Open log followers by jail name
+const jailLogSources = {};
+
+function toggleJailLog(jailName, button) {
+    const item = button.closest('.jail-config-item');
+    if (jailLogSources[jailName]) {
+        jailLogSources[jailName].close();
+        delete jailLogSources[jailName];
+        item.querySelector('.jail-log')?.remove();
+        button.textContent = 'Log';
+        return;
+    }
+    
+    const output = document.createElement('pre');
+    output.className = 'jail-log';
+    item.appendChild(output);
+    button.textContent = 'Close log';
+    
+    const append = text => {
+        const atBottom = output.scrollTop + output.clientHeight >= output.scrollHeight - 4;
+        output.textContent += text + '\n';
+        // Keep the view bounded on busy logs
+        if (output.textContent.length > 200000) {
+            output.textContent = output.textContent.slice(-150000);
+        }
+        if (atBottom) output.scrollTop = output.scrollHeight;
+    };
+    
+    const source = new EventSource(`/api/jails/${encodeURIComponent(jailName)}/log?follow=1&lines=200&token=${encodeURIComponent(getToken())}`);
+    jailLogSources[jailName] = source;
+    // A reconnect starts again with the tail
+    source.onopen = () => { output.textContent = ''; };
+    source.addEventListener('line', event => append(JSON.parse(event.data)));
+    source.addEventListener('rotated', () => append('--- log rotated ---'));
+    source.addEventListener('truncated', () => append('--- log truncated ---'));
+    source.onerror = () => {
+        if (source.readyState === EventSource.CLOSED) {
+            append('--- log unavailable ---');
+        }
+    };
+}
+
 function editJail(jailName) {
     fetch('/api/jails/config', {
         headers: {
@@ -721,13 +824,14 @@ function deleteJailConfig(jailName) {
         headers: headers
     })
     .then(response => response.json())
+    .then(data => data.status === 'accepted' ? waitForChange(data.change_id) : data)
     .then(data => {
         // Remove loading indicator
         if (document.body.contains(loadingDiv)) {
             document.body.removeChild(loadingDiv);
         }
         
-        if (data.status === 'success') {
+        if (data.status === 'applied') {
             alert(`✅ Jail ${jailName} deleted successfully!`);
             loadJailConfigs();
             renderJailList(); // Refresh active jails
@@ -791,13 +895,14 @@ function deleteJail(jailName) {
         }
     })
     .then(response => response.json())
+    .then(data => data.status === 'accepted' ? waitForChange(data.change_id) : data)
     .then(data => {
         // Remove loading indicator
         if (document.body.contains(loadingDiv)) {
             document.body.removeChild(loadingDiv);
         }
         
-        if (data.status === 'success') {
+        if (data.status === 'applied') {
             alert('✅ Jail deleted successfully');
             loadJailConfigs();
             renderJailList(); // Refresh active jails
@@ -881,8 +986,8 @@ function viewBannedIPs(jailName) {
         const container = document.getElementById('banned-ips');
         container.innerHTML = '';
         
-        if (data.status) {
-            const { bannedIPs } = parseJailStatus(data.status);
+        if (data.bans) {
+            const bannedIPs = data.bans.map(ban => ban.ip);
             
             if (bannedIPs.length > 0) {
                 const listElement = document.createElement('div');
@@ -892,7 +997,7 @@ function viewBannedIPs(jailName) {
                 table.className = 'ip-table';
                 table.id = 'ip-table';
                 
-                renderIPTable(table, bannedIPs, jailName);
+                renderIPTable(table, data.bans, jailName);
                 
                 listElement.appendChild(table);
                 container.appendChild(listElement);
@@ -953,6 +1058,12 @@ function banIP() {
         if (data.jails && data.jails.length > 0) {
             const jail = data.jails[0];
             
+            // Several addresses go through the bulk endpoint
+            if (/[\s,]/.test(ip.trim())) {
+                banIPsBulk(jail, ip);
+                return;
+            }
+            
             fetch('/api/ban', {
                 method: 'POST',
                 headers: {
@@ -982,6 +1093,87 @@ function banIP() {
     });
 }
 
+function banIPsBulk(jail, ips) {
+    fetch('/api/ban/bulk', {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json',
+            'Authorization': 'Bearer ' + getToken()
+        },
+        body: JSON.stringify({
+            jail: jail,
+            ips: ips,
+            expand: false
+        })
+    })
+    .then(response => {
+        if (!response.ok) {
+            return response.json().then(data => { throw new Error(data.error); });
+        }
+        return response.text();
+    })
+    .then(text => {
+        // Newline-delimited JSON, the last line holds the summary
+        const lines = text.trim().split('\n').map(line => JSON.parse(line));
+        const summary = lines[lines.length - 1].summary || {};
+        alert(`Banned ${summary.banned || 0}, skipped ${summary.skipped || 0}, ` +
+              `invalid ${summary.invalid || 0}, failed ${summary.failed || 0} in ${jail}`);
+        document.getElementById('ip-to-ban').value = '';
+        renderBannedIPs();
+    })
+    .catch(error => {
+        console.error('Error banning IPs:', error);
+        alert('Error banning IPs: ' + error.message);
+    });
+}
+
+// Upload a blocklist file to the selected jail; the server bans it in the background
+function importBlocklist(input) {
+    const file = input.files[0];
+    input.value = '';
+    const jail = bannedListState.jail;
+    if (!file || !jail) {
+        alert('Select a jail before importing a blocklist');
+        return;
+    }
+    
+    const button = document.getElementById('import-button');
+    button.disabled = true;
+    button.textContent = 'Uploading...';
+    fetch(`/api/ban/import?jail=${encodeURIComponent(jail)}`, {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'text/plain',
+            'Authorization': 'Bearer ' + getToken()
+        },
+        body: file
+    })
+    .then(response => response.json())
+    .then(data => {
+        if (data.status !== 'accepted') {
+            throw new Error(data.error || 'Upload failed');
+        }
+        return waitForJob(data.job_id, job => { button.textContent = job.progress; });
+    })
+    .then(job => {
+        if (job.status !== 'succeeded') {
+            throw new Error(job.error || 'Import failed');
+        }
+        const result = job.result;
+        alert(`Imported ${result.lines} lines into ${jail}: banned ${result.banned}, ` +
+              `skipped ${result.already_banned + result.ignored}, invalid ${result.invalid}, failed ${result.failed}`);
+        fetchJailDetails(jail);
+    })
+    .catch(error => {
+        console.error('Error importing blocklist:', error);
+        alert('Error importing blocklist: ' + error.message);
+    })
+    .finally(() => {
+        button.disabled = false;
+        button.textContent = 'Import';
+    });
+}
+
 function unbanIP(jailName, ipAddress) {
     fetch('/api/unban', {
         method: 'POST',
@@ -1023,6 +1215,57 @@ function filterIPs() {
     });
 }
 
+function searchAllJails() {
+    const query = document.getElementById('ip-search').value.trim();
+    if (!query) {
+        alert('Enter an IP address or CIDR range to search for');
+        return;
+    }
+    
+    authenticatedFetch(`/api/search?ip=${encodeURIComponent(query)}`)
+    .then(data => {
+        const container = document.getElementById('banned-ips');
+        const more = data.matched > data.results.length ? ` (showing ${data.results.length})` : '';
+        const heading = document.createElement('h3');
+        heading.textContent = `${data.matched} ban(s) matching ${data.query}${more}`;
+        container.innerHTML = '';
+        container.appendChild(heading);
+        if (data.results.length === 0) {
+            return;
+        }
+        
+        const table = document.createElement('table');
+        table.className = 'ip-table';
+        table.innerHTML = '<thead><tr><th>IP Address</th><th>Jail</th><th>Actions</th></tr></thead>';
+        const body = document.createElement('tbody');
+        data.results.forEach(result => {
+            result.jails.forEach(entry => {
+                const row = document.createElement('tr');
+                row.className = 'ip-item';
+                const ipCell = document.createElement('td');
+                ipCell.textContent = result.ip;
+                const jailCell = document.createElement('td');
+                jailCell.textContent = entry.jail;
+                const actionCell = document.createElement('td');
+                actionCell.className = 'ip-cell';
+                const button = document.createElement('button');
+                button.className = 'unban-button';
+                button.textContent = 'Unban';
+                button.onclick = () => unbanIP(entry.jail, result.ip);
+                actionCell.appendChild(button);
+                row.append(ipCell, jailCell, actionCell);
+                body.appendChild(row);
+            });
+        });
+        table.appendChild(body);
+        container.appendChild(table);
+    })
+    .catch(error => {
+        console.error('Error searching bans:', error);
+        alert('Error searching bans: ' + error.message);
+    });
+}
+
 // Utility functions
 function getToken() {
     return localStorage.getItem('token') || document.cookie.replace(/(?:(?:^|.*;\s*)token\s*\=\s*([^;]*).*$)|^.*$/, "$1");
@@ -1119,7 +1362,8 @@ function fetchJails() {
         'Content-Type': 'application/json'
     };
     
-    fetch('/api/jails', { headers })
+    // One request for all jails and their counters
+    fetch('/api/overview', { headers })
         .then(response => {
             if (response.status === 401) {
                 // Token expired or invalid
@@ -1147,7 +1391,9 @@ function fetchJails() {
             }
             
             const jailsList = document.getElementById('jails-list');
-            if (!Array.isArray(data.jails) || data.jails.length === 0) {
+            const summaries = Array.isArray(data.jails) ? data.jails : [];
+            const jails = summaries.map(summary => summary.jail);
+            if (jails.length === 0) {
                 jailsList.innerHTML = '<p>No active jails found</p>';
                 return;
             }
@@ -1161,11 +1407,15 @@ function fetchJails() {
             const columns = windowWidth > 1200 ? 4 : windowWidth > 768 ? 3 : windowWidth > 480 ? 2 : 1;
             
             // Create rows
-            for (let i = 0; i < data.jails.length; i += columns) {
+            for (let i = 0; i < jails.length; i += columns) {
                 const row = document.createElement('tr');
                 for (let j = 0; j < columns; j++) {
-                    if (i + j < data.jails.length) {
-                        const jail = data.jails[i + j];
+                    if (i + j < jails.length) {
+                        const summary = summaries[i + j];
+                        const jail = summary.jail;
+                        const counts = summary.error
+                            ? summary.error
+                            : `${summary.currently_banned} banned, ${summary.currently_failed} failing`;
                         const cell = document.createElement('td');
                         cell.innerHTML = `
                             <div class="jail-cell">
@@ -1174,7 +1424,8 @@ function fetchJails() {
                                        name="jail-selection" 
                                        value="${jail}"
                                        onchange="handleJailSelection('${jail}')">
-                                <label for="jail-${jail}">${jail}</label>
+                                <label for="jail-${jail}" title="${counts} (${summary.elapsed_ms} ms)">${jail}</label>
+                                <span class="jail-counts">${summary.error ? '!' : summary.currently_banned}</span>
                             </div>
                         `;
                         row.appendChild(cell);
@@ -1188,8 +1439,8 @@ function fetchJails() {
             jailsList.appendChild(table);
             
             // Select the first jail by default
-            if (data.jails.length > 0) {
-                const firstJail = data.jails[0];
+            if (jails.length > 0) {
+                const firstJail = jails[0];
                 const firstRadio = document.getElementById(`jail-${firstJail}`);
                 if (firstRadio) {
                     firstRadio.checked = true;
@@ -1225,24 +1476,49 @@ window.handleJailSelection = function(jail) {
     fetchJailDetails(jail);
 };
 
-window.fetchJailDetails = function(jail) {
+// Search and paging state of the banned IP listing
+let bannedListState = { jail: null, query: '', cursor: null, shown: 0 };
+
+window.fetchJailDetails = function(jail, append = false) {
     const token = getToken();
     const headers = {
         'Authorization': `Bearer ${token}`,
         'Content-Type': 'application/json'
     };
     
-    fetch(`/api/banned/${jail}`, { headers })
+    if (bannedListState.jail !== jail) {
+        bannedListState = { jail: jail, query: bannedListState.query, cursor: null, shown: 0 };
+    }
+    const params = new URLSearchParams();
+    if (bannedListState.query) {
+        params.set('q', bannedListState.query);
+    }
+    if (append && bannedListState.cursor) {
+        params.set('cursor', bannedListState.cursor);
+    }
+    
+    fetch(`/api/banned/${jail}?${params}`, { headers })
         .then(response => response.json())
         .then(data => {
+            if (data.error) throw new Error(data.error);
             const bannedIPsContainer = document.getElementById('banned-ips');
-            const { bannedIPs } = parseJailStatus(data.status);
+            const bannedIPs = data.bans.map(ban => ban.ip);
+            bannedListState.cursor = data.next_cursor;
+            bannedListState.shown = (append ? bannedListState.shown : 0) + bannedIPs.length;
             
-            if (bannedIPs.length > 0) {
+            if (append) {
+                renderIPTable(document.getElementById('ip-table'), data.bans, jail);
+            } else if (bannedIPs.length > 0) {
                 bannedIPsContainer.innerHTML = `
                     <table class="ip-table" id="ip-table"></table>
+                    <div id="ip-table-more"></div>
                 `;
-                renderIPTable(document.getElementById('ip-table'), bannedIPs, jail);
+                if (data.geo) {
+                    bannedIPsContainer.prepend(renderGeoSummary(data.geo));
+                }
+                renderIPTable(document.getElementById('ip-table'), data.bans, jail);
+            } else if (bannedListState.query) {
+                bannedIPsContainer.innerHTML = `<p>No banned IPs in ${jail} match ${bannedListState.query}.</p>`;
             } else {
                 bannedIPsContainer.innerHTML = `
                     <div style="text-align: center; padding: 1rem; margin-top: 1rem; background: #f8f9fa; border-radius: 6px; border: 1px dashed #dee2e6;">
@@ -1253,6 +1529,15 @@ window.fetchJailDetails = function(jail) {
                     </div>
                 `;
             }
+            
+            const more = document.getElementById('ip-table-more');
+            if (more) {
+                more.innerHTML = data.next_cursor ? `
+                    <button onclick="fetchJailDetails('${jail}', true)" class="refresh-button">
+                        Load more (${bannedListState.shown} of ${data.matched})
+                    </button>
+                ` : '';
+            }
         })
         .catch(error => {
             console.error('Error:', error);
@@ -1313,37 +1598,116 @@ document.getElementById('logout-btn').addEventListener('click', function() {
 
 // Initial load
 fetchJails();
-    
-// Refresh every 30 seconds
-setInterval(fetchJails, 30000);
-
-function parseJailStatus(statusText) {
-    const bannedIPsMatch = statusText.match(/Banned IP list:\t(.+)$/);
-    if (!bannedIPsMatch) return { bannedIPs: [] };
 
-    const bannedIPs = bannedIPsMatch[1].split(' ').filter(ip => ip.trim());
-    return { bannedIPs };
+// Live updates pushed by the server; poll every 30 seconds only as a fallback
+function startLiveUpdates() {
+    if (!window.EventSource) {
+        setInterval(fetchJails, 30000);
+        return;
+    }
+    
+    const source = new EventSource(`/api/events?token=${encodeURIComponent(getToken())}`);
+    let refreshTimer;
+    const refreshSelectedJail = event => {
+        const data = JSON.parse(event.data);
+        if (data.jail !== bannedListState.jail) return;
+        // Coalesce bursts of bans into one refresh
+        clearTimeout(refreshTimer);
+        refreshTimer = setTimeout(() => fetchJailDetails(bannedListState.jail), 250);
+    };
+    
+    source.addEventListener('ban', refreshSelectedJail);
+    source.addEventListener('unban', refreshSelectedJail);
+    source.addEventListener('jail_started', fetchJails);
+    source.addEventListener('jail_stopped', fetchJails);
+    source.onerror = () => {
+        // EventSource reconnects by itself unless the server refused the stream
+        if (source.readyState === EventSource.CLOSED) {
+            setInterval(fetchJails, 30000);
+        }
+    };
 }
 
+startLiveUpdates();
+
 function isSubnet(ip) {
     return ip.includes('/');
 }
 
 // Add function to render IP table
-function renderIPTable(table, ips, jail) {
+function formatRemaining(ban) {
+    if (ban.permanent) {
+        return 'permanent';
+    }
+    if (ban.remaining === undefined || ban.remaining === null) {
+        return '';
+    }
+    const seconds = Math.round(ban.remaining);
+    if (seconds >= 86400) return `${Math.floor(seconds / 86400)}d ${Math.floor(seconds % 86400 / 3600)}h left`;
+    if (seconds >= 3600) return `${Math.floor(seconds / 3600)}h ${Math.floor(seconds % 3600 / 60)}m left`;
+    if (seconds >= 60) return `${Math.floor(seconds / 60)}m ${seconds % 60}s left`;
+    return `${seconds}s left`;
+}
+
+function formatGeo(ban) {
+    if (!ban.country && !ban.asn) {
+        return { label: '', title: '' };
+    }
+    const label = [ban.country, ban.asn ? `AS${ban.asn}` : null].filter(Boolean).join(' · ');
+    return { label: label, title: ban.as_org || '' };
+}
+
+// Top countries and networks of a jail's bans, present when GeoIP databases are configured.
+// Names come from the GeoIP databases, so they are set as text, never as HTML
+function renderGeoSummary(geo) {
+    const summary = document.createElement('div');
+    summary.className = 'geo-summary';
+    
+    const countries = document.createElement('div');
+    const countriesLabel = document.createElement('strong');
+    countriesLabel.textContent = 'Countries:';
+    countries.append(countriesLabel, ' ' + geo.countries.map(entry => `${entry.country || 'Unknown'} ${entry.count}`).join(', '));
+    
+    const networks = document.createElement('div');
+    const networksLabel = document.createElement('strong');
+    networksLabel.textContent = 'Networks:';
+    networks.append(networksLabel, ' ');
+    geo.asns.forEach((entry, index) => {
+        if (index > 0) networks.append(', ');
+        if (entry.asn) {
+            const asn = document.createElement('span');
+            asn.textContent = `AS${entry.asn}`;
+            asn.title = entry.as_org || '';
+            networks.append(asn, ` ${entry.count}`);
+        } else {
+            networks.append(`Unknown ${entry.count}`);
+        }
+    });
+    
+    summary.append(countries, networks);
+    return summary;
+}
+
+// bans are {ip, remaining, expires_at, ...} entries from /api/banned
+function renderIPTable(table, bans, jail) {
     const tbody = document.createElement('tbody');
     const windowWidth = window.innerWidth;
     const columns = windowWidth > 1200 ? 4 : windowWidth > 768 ? 3 : windowWidth > 480 ? 2 : 1;
     
-    for (let i = 0; i < ips.length; i += columns) {
+    for (let i = 0; i < bans.length; i += columns) {
         const row = document.createElement('tr');
         for (let j = 0; j < columns; j++) {
-            if (i + j < ips.length) {
-                const ip = ips[i + j];
+            if (i + j < bans.length) {
+                const ip = bans[i + j].ip;
+                const remaining = formatRemaining(bans[i + j]);
+                const expires = bans[i + j].expires_at ? new Date(bans[i + j].expires_at * 1000).toLocaleString() : '';
+                const geo = formatGeo(bans[i + j]);
                 const cell = document.createElement('td');
                 cell.innerHTML = `
                     <div class="ip-cell ${isSubnet(ip) ? 'subnet' : ''}">
                         <span>${ip}</span>
+                        <span class="ban-geo"></span>
+                        <span class="ban-remaining" title="${expires ? 'Expires ' + expires : ''}">${remaining}</span>
                         <button onclick="unbanIP('${jail}', '${ip}')" class="unban-button">
                             <svg viewBox="0 0 24 24" width="16" height="16">
                                 <path fill="currentColor" d="M19,4H15.5L14.5,3H9.5L8.5,4H5V6H19M6,19A2,2 0 0,0 8,21H16A2,2 0 0,0 18,19V7H6V19Z"/>
@@ -1351,6 +1715,9 @@ function renderIPTable(table, ips, jail) {
                         </button>
                     </div>
                 `;
+                const geoLabel = cell.querySelector('.ban-geo');
+                geoLabel.textContent = geo.label;
+                geoLabel.title = geo.title;
                 row.appendChild(cell);
             }
         }
@@ -1361,18 +1728,14 @@ function renderIPTable(table, ips, jail) {
 }
 
 // Add global filter function
+// Searching happens server side so large jails never ship their full list
+let ipSearchTimer;
 window.filterIPs = function() {
-    const searchInput = document.getElementById('ip-search');
-    const filter = searchInput.value.toLowerCase();
-    const table = document.getElementById('ip-table');
-    const cells = table.getElementsByClassName('ip-cell');
-
-    for (let cell of cells) {
-        const ip = cell.querySelector('span').textContent;
-        if (ip.toLowerCase().includes(filter)) {
-            cell.closest('td').style.display = "";
-        } else {
-            cell.closest('td').style.display = "none";
+    clearTimeout(ipSearchTimer);
+    ipSearchTimer = setTimeout(() => {
+        bannedListState.query = document.getElementById('ip-search').value.trim();
+        if (bannedListState.jail) {
+            fetchJailDetails(bannedListState.jail);
         }
-    }
+    }, 300);
 }